@@ -5,10 +5,14 @@ import argparse
 import json
 import math
 import re
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple, Set
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Tuple, Set
 
-import networkx as nx
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
 
 
 def find_project_root(start: Path | None = None) -> Path:
@@ -22,22 +26,35 @@ def find_project_root(start: Path | None = None) -> Path:
 
 
 def load_json(path: Path):
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def build_graph(nodes_raw: List[Dict], edges_raw: List[Dict]) -> nx.Graph:
-    G = nx.Graph()
-    for n in nodes_raw:
-        nid = n.get("id")
-        if isinstance(nid, str):
-            G.add_node(nid, **n)
-    for e in edges_raw:
-        s = e.get("source")
-        t = e.get("target")
-        if isinstance(s, str) and isinstance(t, str):
-            G.add_edge(s, t, **e)
-    return G
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+def largest_component_size(adj: Dict[str, Set[str]], node_ids: Set[str]) -> int:
+    """Size of the largest connected component (iterative BFS over an undirected adjacency).
+
+    Stops as soon as the unvisited nodes can no longer form a larger component.
+    """
+    seen: Set[str] = set()
+    largest = 0
+    for start in node_ids:
+        if largest >= len(node_ids) - len(seen):
+            break
+        if start in seen:
+            continue
+        seen.add(start)
+        queue = deque([start])
+        size = 0
+        while queue:
+            n = queue.popleft()
+            size += 1
+            for m in adj.get(n, ()):
+                if m not in seen:
+                    seen.add(m)
+                    queue.append(m)
+        largest = max(largest, size)
+    return largest
 
 
 WORD_RE = re.compile(r"[A-Za-z']+")
@@ -49,105 +66,185 @@ def text_tokens(s: str) -> Set[str]:
     return {t.lower() for t in WORD_RE.findall(s)}
 
 
-def judge_edge_auto(e: Dict, id2node: Dict[str, Dict]) -> Tuple[bool, bool, bool]:
-    """Return (valid_strict, valid_lenient, directed_ok). Heuristic only."""
-    s = e.get("source"); t = e.get("target"); rel = str(e.get("relation", "related"))
-    ns = id2node.get(s, {}); nt = id2node.get(t, {})
-    ts = str(ns.get("type") or "").lower(); tt = str(nt.get("type") or "").lower()
-    pos_s = str(ns.get("pos") or "").lower(); pos_t = str(nt.get("pos") or "").lower()
-    tags_s = set(ns.get("tags") or []); tags_t = set(nt.get("tags") or [])
-    en_s = str(ns.get("en") or ""); en_t = str(nt.get("en") or "")
-    ex_t = str(nt.get("ex") or "")
-    toks_s = text_tokens(en_s); toks_t = text_tokens(en_t)
+VOCAB = "vocabulary_entry"
+GRAMMAR = "grammar_pattern"
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class NodeFields(NamedTuple):
+    """Per-node attributes read by the edge judges, normalised once (keyed by node id)."""
+    type: Dict[str, str]
+    pos: Dict[str, str]
+    tags: Dict[str, FrozenSet[str]]
+    label: Dict[str, str]
+    ex: Dict[str, str]
+    toks: Dict[str, FrozenSet[str]]
+
+
+def build_node_fields(id2node: Dict[str, Dict]) -> NodeFields:
+    items = id2node.items()
+    return NodeFields(
+        type={nid: str(n.get("type") or "").lower() for nid, n in items},
+        pos={nid: str(n.get("pos") or "").lower() for nid, n in items},
+        tags={nid: frozenset(n.get("tags") or ()) for nid, n in items},
+        label={nid: str(n.get("label") or "") for nid, n in items},
+        ex={nid: str(n.get("ex") or "") for nid, n in items},
+        toks={nid: frozenset(text_tokens(str(n.get("en") or ""))) for nid, n in items},
+    )
+
+
+def judge_appears_in_example(f: NodeFields, s: str, t: str, tag: str) -> Tuple[bool, bool, bool]:
+    ok = f.type.get(s) == VOCAB and f.type.get(t) == GRAMMAR
+    strict = ok and f.label.get(s, "") in f.ex.get(t, "")
+    return strict, ok, ok
+
+
+def judge_pos(f: NodeFields, s: str, t: str, tag: str) -> Tuple[bool, bool, bool]:
+    ok = f.type.get(s) == VOCAB and f.type.get(t) == VOCAB
+    strict = ok and bool(f.pos.get(s)) and bool(f.pos.get(t))
+    return strict, ok, False
+
+
+def judge_jlpt_vocab(f: NodeFields, s: str, t: str, tag: str) -> Tuple[bool, bool, bool]:
+    ok = f.type.get(s) == VOCAB and f.type.get(t) == VOCAB
+    strict = ok and tag in f.tags.get(s, _EMPTY) and tag in f.tags.get(t, _EMPTY)
+    return strict, ok, False
+
+
+def judge_jlpt_grammar(f: NodeFields, s: str, t: str, tag: str) -> Tuple[bool, bool, bool]:
+    ok = f.type.get(s) == GRAMMAR and f.type.get(t) == GRAMMAR
+    strict = ok and tag in f.tags.get(s, _EMPTY) and tag in f.tags.get(t, _EMPTY)
+    return strict, ok, False
+
+
+def judge_tag(f: NodeFields, s: str, t: str, tag: str) -> Tuple[bool, bool, bool]:
+    strict = tag in f.tags.get(s, _EMPTY) and tag in f.tags.get(t, _EMPTY)
+    return strict, True, False
+
+
+def judge_semantic_similarity(f: NodeFields, s: str, t: str, tag: str) -> Tuple[bool, bool, bool]:
+    ok = f.type.get(s) == VOCAB and f.type.get(t) == VOCAB
+    overlap = len(f.toks.get(s, _EMPTY) & f.toks.get(t, _EMPTY)) if ok else 0
+    return ok and overlap >= 2, ok and overlap >= 1, False
+
 
-    strict = False; lenient = False; directed_ok = False
+def judge_other(f: NodeFields, s: str, t: str, tag: str) -> Tuple[bool, bool, bool]:
+    ts = f.type.get(s, ""); tt = f.type.get(t, "")
+    strict = (ts == tt) or (ts == VOCAB and tt == GRAMMAR)
+    return strict, True, False
 
+
+# Relations of the form "<family>:<tag>"
+TAGGED_RELATION_HANDLERS = {
+    "pos": judge_pos,
+    "jlpt_vocab": judge_jlpt_vocab,
+    "jlpt_grammar": judge_jlpt_grammar,
+    "tag": judge_tag,
+}
+
+def resolve_relation(rel: str):
+    """Map a relation string to (handler, tag) once, instead of a startswith chain per edge."""
+    family, sep, tag = rel.partition(":")
+    if sep and family in TAGGED_RELATION_HANDLERS:
+        return TAGGED_RELATION_HANDLERS[family], tag
     if rel.startswith("appears_in_example"):
-        strict = (ts == "vocabulary_entry" and tt == "grammar_pattern" and (str(ns.get("label") or "") in ex_t))
-        lenient = (ts == "vocabulary_entry" and tt == "grammar_pattern")
-        directed_ok = (ts == "vocabulary_entry" and tt == "grammar_pattern")
-    elif rel.startswith("pos:"):
-        strict = (ts == "vocabulary_entry" and tt == "vocabulary_entry" and bool(pos_s) and bool(pos_t))
-        lenient = (ts == "vocabulary_entry" and tt == "vocabulary_entry")
-    elif rel.startswith("jlpt_vocab:"):
-        tag = rel.split(":", 1)[1]
-        strict = (ts == "vocabulary_entry" and tt == "vocabulary_entry" and (tag in tags_s) and (tag in tags_t))
-        lenient = (ts == "vocabulary_entry" and tt == "vocabulary_entry")
-    elif rel.startswith("jlpt_grammar:"):
-        tag = rel.split(":", 1)[1]
-        strict = (ts == "grammar_pattern" and tt == "grammar_pattern" and (tag in tags_s) and (tag in tags_t))
-        lenient = (ts == "grammar_pattern" and tt == "grammar_pattern")
-    elif rel.startswith("tag:"):
-        tag = rel.split(":", 1)[1]
-        strict = (tag in tags_s) and (tag in tags_t)
-        lenient = True
-    elif rel.startswith("semantic_similarity"):
-        overlap = len(toks_s & toks_t)
-        strict = (ts == "vocabulary_entry" and tt == "vocabulary_entry" and overlap >= 2)
-        lenient = (ts == "vocabulary_entry" and tt == "vocabulary_entry" and overlap >= 1)
-    else:
-        strict = (ts == tt) or (ts == "vocabulary_entry" and tt == "grammar_pattern")
-        lenient = True
+        return judge_appears_in_example, ""
+    if rel.startswith("semantic_similarity"):
+        return judge_semantic_similarity, ""
+    return judge_other, ""
 
-    return bool(strict), bool(lenient), bool(directed_ok)
 
+def judge_edge_auto(e: Dict, id2node: Dict[str, Dict]) -> Tuple[bool, bool, bool]:
+    """Return (valid_strict, valid_lenient, directed_ok). Heuristic only."""
+    s = e.get("source"); t = e.get("target")
+    handler, tag = resolve_relation(str(e.get("relation", "related")))
+    fields = build_node_fields({nid: id2node[nid] for nid in (s, t) if nid in id2node})
+    return handler(fields, s, t, tag)
 
-def cohen_kappa_from_bools(a: List[bool], b: List[bool]) -> float:
-    if not a or not b or len(a) != len(b):
+
+def cohen_kappa_from_counts(n: int, a_yes: int, b_yes: int, agree: int) -> float:
+    """Cohen's kappa for two boolean raters given only the totals."""
+    if not n:
         return 0.0
-    a_i = [1 if x else 0 for x in a]
-    b_i = [1 if x else 0 for x in b]
-    n = len(a_i)
-    pa = sum(1 for i in range(n) if a_i[i] == b_i[i]) / n
-    p_yes = (sum(a_i) / n + sum(b_i) / n) / 2
+    pa = agree / n
+    p_yes = (a_yes / n + b_yes / n) / 2
     p_no = 1 - p_yes
     pe = p_yes ** 2 + p_no ** 2
     return 1.0 if pe == 1 else (pa - pe) / (1 - pe)
 
 
+def cohen_kappa_from_bools(a: List[bool], b: List[bool]) -> float:
+    if not a or not b or len(a) != len(b):
+        return 0.0
+    sa = sb = agree = 0
+    for x, y in zip(a, b):
+        sa += x
+        sb += y
+        agree += x == y
+    return cohen_kappa_from_counts(len(a), sa, sb, agree)
+
+
 def compute_metrics(nodes_raw: List[Dict], edges_raw: List[Dict]) -> Dict[str, float]:
-    G = build_graph(nodes_raw, edges_raw)
-    id2node = {n: G.nodes[n] for n in G.nodes}
+    id2node = {n["id"]: n for n in nodes_raw if isinstance(n.get("id"), str)}
+    fields = build_node_fields(id2node)
+    adj: Dict[str, Set[str]] = defaultdict(set)
+
+    root = find_project_root()
+    prev_edges = root / "network_output" / "edges_prev.json"
+    track_edges = prev_edges.exists()
+    cur_set: Set[str] = set()
 
-    # Structure
-    num_nodes = G.number_of_nodes()
-    components = sorted(nx.connected_components(G), key=len, reverse=True)
-    main_component_share = (len(components[0]) / num_nodes) if components and num_nodes else 0.0
-    orphans_share = (sum(1 for n, d in G.degree() if d == 0) / num_nodes) if num_nodes else 0.0
+    # Single pass: adjacency, auto baseline correctness, direction, edge set
+    strict_count = lenient_count = agree_count = 0
+    dir_ok_count = dir_total = 0
+    resolved: Dict[str, Tuple] = {}
+    for e in edges_raw:
+        s = e.get("source"); t = e.get("target")
+        if isinstance(s, str) and isinstance(t, str):
+            adj[s].add(t)
+            adj[t].add(s)
+        rel = str(e.get("relation", "related"))
+        handler_tag = resolved.get(rel)
+        if handler_tag is None:
+            handler_tag = resolved[rel] = resolve_relation(rel)
+        handler, tag = handler_tag
+        s_ok, l_ok, d_ok = handler(fields, s, t, tag)
+        strict_count += s_ok
+        lenient_count += l_ok
+        agree_count += s_ok == l_ok
+        if handler is judge_appears_in_example:
+            dir_total += 1
+            dir_ok_count += d_ok
+        if track_edges:
+            cur_set.add(f"{s}\x1f{t}\x1f{e.get('relation')}")
+
+    num_edges = len(edges_raw)
+    precision = (strict_count / num_edges) if num_edges else 0.0
+    direction_accuracy = (dir_ok_count / dir_total) if dir_total else 1.0
+    kappa = cohen_kappa_from_counts(num_edges, strict_count, lenient_count, agree_count)
+
+    # Structure (edge endpoints missing from nodes_raw still count as nodes)
+    node_ids = id2node.keys() | adj.keys()
+    num_nodes = len(node_ids)
+    largest = largest_component_size(adj, node_ids)
+    main_component_share = (largest / num_nodes) if num_nodes else 0.0
+    orphans_share = (sum(1 for nid in id2node if not adj.get(nid)) / num_nodes) if num_nodes else 0.0
 
     # Core coverage (unique keywords)
     core_keywords = {"は", "を", "に", "で", "の", "が", "です", "ます", "いる", "ある", "食べる", "行く", "来る"}
-    node_labels = {n: (id2node[n].get("label") or id2node[n].get("id") or "") for n in G.nodes}
-    covered = set()
-    for kw in core_keywords:
-        for lbl in node_labels.values():
-            if kw in str(lbl):
-                covered.add(kw)
-                break
+    labels = [str(nd.get("label") or nd.get("id") or "") for nd in id2node.values()]
+    remaining = set(core_keywords)
+    for lbl in labels:
+        remaining.difference_update([kw for kw in remaining if kw in lbl])
+        if not remaining:
+            break
+    covered = core_keywords - remaining
     core_coverage_percent = (len(covered) / max(1, len(core_keywords))) * 100.0
 
-    # Auto baseline correctness
-    valid_strict: List[bool] = []
-    valid_lenient: List[bool] = []
-    dir_flags: List[bool] = []
-    for e in edges_raw:
-        s_ok, l_ok, d_ok = judge_edge_auto(e, id2node)
-        valid_strict.append(s_ok)
-        valid_lenient.append(l_ok)
-        if str(e.get("relation", "")).startswith("appears_in_example"):
-            dir_flags.append(d_ok)
-
-    precision = (sum(1 for x in valid_strict if x) / len(valid_strict)) if valid_strict else 0.0
-    direction_accuracy = (sum(1 for x in dir_flags if x) / len(dir_flags)) if dir_flags else 1.0
-    kappa = cohen_kappa_from_bools(valid_strict, valid_lenient)
-
     # Reproducibility
-    root = find_project_root()
-    prev_edges = root / "network_output" / "edges_prev.json"
-    if prev_edges.exists():
+    if track_edges:
         prev_raw = load_json(prev_edges)
-        cur_set = {(e.get("source"), e.get("target"), e.get("relation")) for e in edges_raw}
-        prev_set = {(e.get("source"), e.get("target"), e.get("relation")) for e in prev_raw}
+        prev_set = {f"{e.get('source')}\x1f{e.get('target')}\x1f{e.get('relation')}" for e in prev_raw}
         inter = len(cur_set & prev_set)
         union = len(cur_set | prev_set)
         edge_jaccard = (inter / union) if union else 1.0
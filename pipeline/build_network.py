@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import json
+from dataclasses import dataclass, fields, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from collections import defaultdict
 import random
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_CLEAN = ROOT / "data" / "clean"
 OUT_DIR = ROOT / "network_output"
@@ -13,6 +19,24 @@ OUT_DIR.mkdir(exist_ok=True)
 
 random.seed(42)
 
+@dataclass(slots=True)
+class Node:
+    """A network node; field order is the key order written to nodes.json."""
+    id: str
+    label: str
+    type: str
+    pos: str
+    level: Any
+    difficulty: str
+    tags: List[str]
+    en: str
+    ex: Any
+    cluster_key: str
+
+GUIDEBOOK_STATIONERY = "🛒 Learn vocabulary and phrases for buying stationery items like pens, notebooks, and paper.\n\n💡 Useful phrases:\n• これをください (Please give me this)\n• いくらですか (How much is it?)\n• ありがとうございます (Thank you very much)"
+GUIDEBOOK_BUY_FOOD = "🍽️ Learn how to order food and drinks in Japanese restaurants and cafes.\n\n💡 Key vocabulary:\n• メニュー (menu)\n• おいしい (delicious)\n• いただきます (let's eat - said before meals)"
+GUIDEBOOK_ORDER_FOOD = "🍽️ Master food and drink ordering vocabulary and polite expressions.\n\n💡 Key phrases:\n• 〜をください (Please give me...)\n• おいしい (delicious)\n• いただきます (let's eat)"
+
 def enrich_guidebook_content(lesson_topic: str) -> str:
     """Enrich guidebook lesson content with contextual information and examples."""
     if not lesson_topic:
@@ -22,157 +46,184 @@ def enrich_guidebook_content(lesson_topic: str) -> str:
     
     if "buy" in lesson_topic_lower or "purchase" in lesson_topic_lower:
         if "stationery" in lesson_topic_lower:
-            return f"🛒 Learn vocabulary and phrases for buying stationery items like pens, notebooks, and paper.\n\n💡 Useful phrases:\n• これをください (Please give me this)\n• いくらですか (How much is it?)\n• ありがとうございます (Thank you very much)"
+            return GUIDEBOOK_STATIONERY
         elif "food" in lesson_topic_lower:
-            return f"🍽️ Learn how to order food and drinks in Japanese restaurants and cafes.\n\n💡 Key vocabulary:\n• メニュー (menu)\n• おいしい (delicious)\n• いただきます (let's eat - said before meals)"
+            return GUIDEBOOK_BUY_FOOD
     
     elif "order" in lesson_topic_lower:
         if "food" in lesson_topic_lower or "drink" in lesson_topic_lower:
-            return f"🍽️ Master food and drink ordering vocabulary and polite expressions.\n\n💡 Key phrases:\n• 〜をください (Please give me...)\n• おいしい (delicious)\n• いただきます (let's eat)"
+            return GUIDEBOOK_ORDER_FOOD
     
     return ""
 
 def load_json(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
-    return json.loads(path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+def json_default(obj: Any) -> Dict[str, Any]:
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def write_json(path: Path, data: Any) -> None:
+    # orjson serialises dataclasses (such as Node) natively
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    # Stream the encoder output instead of building one large str first
+    with path.open("wb") as f:
+        for chunk in json.JSONEncoder(ensure_ascii=False, indent=2, default=json_default).iterencode(data):
+            f.write(chunk.encode("utf-8"))
+
+JLPT_TAGS = ("jlpt", "jlpt_n5", "jlpt_n4", "jlpt_n3", "jlpt_n2", "jlpt_n1")
+VOCAB_TAGS_IGNORED = frozenset(("vocabulary", "anki", *JLPT_TAGS))
+GRAMMAR_TAGS_IGNORED = frozenset(("grammar", *JLPT_TAGS))
+
+def index_lemmas(vocab_lemmas: Dict[str, str]) -> Tuple[Dict[str, List[Tuple[int, str]]], List[int]]:
+    """Index lemmas by text so example sentences can be matched by substring lookup."""
+    by_lemma: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+    for order, (vid, lemma) in enumerate(vocab_lemmas.items()):
+        if lemma:
+            by_lemma[lemma].append((order, vid))
+    return by_lemma, sorted({len(lemma) for lemma in by_lemma})
+
+def lemmas_in_text(text: str, lemma_index: Tuple[Dict[str, List[Tuple[int, str]]], List[int]]) -> List[str]:
+    """Return ids of every vocab lemma occurring in text, in vocab order."""
+    by_lemma, lengths = lemma_index
+    found = set()
+    for size in lengths:
+        if size > len(text):
+            break
+        for start in range(len(text) - size + 1):
+            hits = by_lemma.get(text[start:start + size])
+            if hits:
+                found.update(hits)
+    return [vid for _, vid in sorted(found)]
 
 def create_meaningful_edges(vocab: List[Dict[str, Any]], grammar: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Create meaningful edges that show educational relationships."""
-    edges = []
+    # (source, target, relation, weight); expanded to dicts once at the end
+    edges: List[Tuple[str, str, str, float]] = []
     
     print("Creating connections...")
+    # Same seeded stream as random.random(), without the module attribute lookup per draw
+    rand = random.random
     
+    # Group ids by JLPT level, POS, tag and meaning; one pass over each input
     jlpt_to_grammar = defaultdict(list)
-    jlpt_to_vocab = defaultdict(list)
-    
+    tag_to_grammar = defaultdict(list)
     for g in grammar:
-        jlpt = g.get("jlpt_level", "unknown")
-        jlpt_to_grammar[jlpt].append(g["id"])
+        gid = g["id"]
+        jlpt_to_grammar[g.get("jlpt_level", "unknown")].append(gid)
+        for tag in g.get("tags", []):
+            if tag not in GRAMMAR_TAGS_IGNORED:
+                tag_to_grammar[tag].append(gid)
     
+    jlpt_to_vocab = defaultdict(list)
+    pos_to_vocab = defaultdict(list)
+    tag_to_vocab = defaultdict(list)
+    meaning_groups = defaultdict(list)
     for v in vocab:
-        jlpt = "unknown"
-        for tag in v.get("tags", []):
-            if tag.startswith("jlpt_"):
-                jlpt = tag
-                break
-        jlpt_to_vocab[jlpt].append(v["id"])
+        vid = v["id"]
+        tags = v.get("tags", [])
+        jlpt_to_vocab[next((tag for tag in tags if tag.startswith("jlpt_")), "unknown")].append(vid)
+        pos_to_vocab[v.get("pos", "unknown")].append(vid)
+        for tag in tags:
+            if tag not in VOCAB_TAGS_IGNORED:
+                tag_to_vocab[tag].append(vid)
+        meanings = v.get("meanings", [])
+        if meanings:
+            first_meaning = str(meanings[0]).lower()
+            semantic_key = tuple(first_meaning.split(maxsplit=3)[:3])
+            meaning_groups[semantic_key].append(vid)
     
     for jlpt, ids in jlpt_to_grammar.items():
         if len(ids) > 1:
+            relation = f"jlpt_grammar:{jlpt}"
+            max_connections = min(3, len(ids) - 1)
             for i, source_id in enumerate(ids):
                 connections = 0
-                max_connections = min(3, len(ids) - 1)
-                
-                for j in range(len(ids)):
-                    if i != j and connections < max_connections:
+                # Pairs more than 10 apart never link, so only the window around i is scanned
+                for j in range(max(0, i - 10), min(len(ids), i + 11)):
+                    if connections >= max_connections:
+                        break
+                    if i != j:
                         distance = abs(i - j)
-                        if distance <= 3 and random.random() < 0.7:     
-                            edges.append({
-                                "source": source_id,
-                                "target": ids[j],
-                                "relation": f"jlpt_grammar:{jlpt}",
-                                "weight": 1.0
-                            })
+                        if distance <= 3 and rand() < 0.7:     
+                            edges.append((source_id, ids[j], relation, 1.0))
                             connections += 1
-                        elif distance <= 10 and random.random() < 0.3:
-                            edges.append({
-                                "source": source_id,
-                                "target": ids[j],
-                                "relation": f"jlpt_grammar:{jlpt}",
-                                "weight": 0.8
-                            })
+                        elif distance <= 10 and rand() < 0.3:
+                            edges.append((source_id, ids[j], relation, 0.8))
                             connections += 1
     
     for jlpt, ids in jlpt_to_vocab.items():
         if len(ids) > 1:
+            relation = f"jlpt_vocab:{jlpt}"
+            max_connections = min(2, len(ids) - 1)
             for i, source_id in enumerate(ids):
                 connections = 0
-                max_connections = min(2, len(ids) - 1)
-                
-                for j in range(len(ids)):
-                    if i != j and connections < max_connections:
+                for j in range(max(0, i - 5), min(len(ids), i + 6)):
+                    if connections >= max_connections:
+                        break
+                    if i != j:
                         distance = abs(i - j)
-                        if distance <= 5 and random.random() < 0.6:
-                            edges.append({
-                                "source": source_id,
-                                "target": ids[j],
-                                "relation": f"jlpt_vocab:{jlpt}",
-                                "weight": 0.9
-                            })
+                        if distance <= 5 and rand() < 0.6:
+                            edges.append((source_id, ids[j], relation, 0.9))
                             connections += 1
     
     # Part of speech connections 
-    pos_to_vocab = defaultdict(list)
-    for v in vocab:
-        pos = v.get("pos", "unknown")
-        pos_to_vocab[pos].append(v["id"])
-    
     for pos, ids in pos_to_vocab.items():
         if len(ids) > 1:
+            relation = f"pos:{pos}"
+            max_connections = min(2, len(ids) - 1)
             for i, source_id in enumerate(ids):
                 connections = 0
-                max_connections = min(2, len(ids) - 1)
-                
-                for j in range(len(ids)):
-                    if i != j and connections < max_connections:
+                for j in range(max(0, i - 8), min(len(ids), i + 9)):
+                    if connections >= max_connections:
+                        break
+                    if i != j:
                         distance = abs(i - j)
-                        if distance <= 8 and random.random() < 0.5:
-                            edges.append({"source": source_id,"target": ids[j],"relation": f"pos:{pos}","weight": 0.7})
+                        if distance <= 8 and rand() < 0.5:
+                            edges.append((source_id, ids[j], relation, 0.7))
                             connections += 1
     
-    tag_to_vocab = defaultdict(list)
-    tag_to_grammar = defaultdict(list)
-    
-    for v in vocab:
-        for tag in v.get("tags", []):
-            if tag not in ["vocabulary", "anki", "jlpt", "jlpt_n5", "jlpt_n4", "jlpt_n3", "jlpt_n2", "jlpt_n1"]:
-                tag_to_vocab[tag].append(v["id"])
-    
-    for g in grammar:
-        for tag in g.get("tags", []):
-            if tag not in ["grammar", "jlpt", "jlpt_n5", "jlpt_n4", "jlpt_n3", "jlpt_n2", "jlpt_n1"]:
-                tag_to_grammar[tag].append(g["id"])
-    
     # Tag connections
     for tag, ids in tag_to_vocab.items():
         if len(ids) > 1:
+            relation = f"tag:{tag}"
+            max_connections = min(2, len(ids) - 1)
             for i, source_id in enumerate(ids):
                 connections = 0
-                max_connections = min(2, len(ids) - 1)
-                
-                for j in range(len(ids)):
-                    if i != j and connections < max_connections:
+                for j in range(max(0, i - 6), min(len(ids), i + 7)):
+                    if connections >= max_connections:
+                        break
+                    if i != j:
                         distance = abs(i - j)
-                        if distance <= 6 and random.random() < 0.6:
-                            edges.append({
-                                "source": source_id,
-                                "target": ids[j],
-                                "relation": f"tag:{tag}",
-                                "weight": 0.6
-                            })
+                        if distance <= 6 and rand() < 0.6:
+                            edges.append((source_id, ids[j], relation, 0.6))
                             connections += 1
     
     for tag, ids in tag_to_grammar.items():
         if len(ids) > 1:
+            relation = f"tag:{tag}"
+            max_connections = min(2, len(ids) - 1)
             for i, source_id in enumerate(ids):
                 connections = 0
-                max_connections = min(2, len(ids) - 1)
-                
-                for j in range(len(ids)):
-                    if i != j and connections < max_connections:
+                for j in range(max(0, i - 4), min(len(ids), i + 5)):
+                    if connections >= max_connections:
+                        break
+                    if i != j:
                         distance = abs(i - j)
-                        if distance <= 4 and random.random() < 0.7:
-                            edges.append({
-                                "source": source_id,
-                                "target": ids[j],
-                                "relation": f"tag:{tag}",
-                                "weight": 0.8
-                            })
+                        if distance <= 4 and rand() < 0.7:
+                            edges.append((source_id, ids[j], relation, 0.8))
                             connections += 1
     
     # Cross type connections    
     vocab_lemmas = {v.get("id"): (v.get("lemma") or "").strip() for v in vocab}
+    lemma_index = index_lemmas(vocab_lemmas)
     
     for g in grammar:
         exs = g.get("examples", []) or []
@@ -180,49 +231,67 @@ def create_meaningful_edges(vocab: List[Dict[str, Any]], grammar: List[Dict[str,
         max_connections = 3
         
         for ex in exs:
+            if connected_count >= max_connections:
+                break
             if isinstance(ex, dict):
                 ja_text = str(ex.get("ja", ""))
                 
-                for vid, lemma in vocab_lemmas.items():
-                    if lemma and lemma in ja_text and connected_count < max_connections:
-                        if random.random() < 0.8:
-                            edges.append({
-                                "source": vid,
-                                "target": g["id"],
-                                "relation": "appears_in_example",
-                                "weight": 0.9
-                            })
-                            connected_count += 1
+                for vid in lemmas_in_text(ja_text, lemma_index):
+                    if connected_count >= max_connections:
+                        break
+                    if rand() < 0.8:
+                        edges.append((vid, g["id"], "appears_in_example", 0.9))
+                        connected_count += 1
     
     # Semantic connections
-    meaning_groups = defaultdict(list)
-    for v in vocab:
-        meanings = v.get("meanings", [])
-        if meanings:
-            first_meaning = str(meanings[0]).lower()
-            key_words = first_meaning.split()[:3]
-            semantic_key = " ".join(key_words)
-            meaning_groups[semantic_key].append(v["id"])
-    
     for semantic_key, ids in meaning_groups.items():
         if len(ids) > 1:
+            max_connections = min(2, len(ids) - 1)
             for i, source_id in enumerate(ids):
                 connections = 0
-                max_connections = min(2, len(ids) - 1)
-                
                 for j in range(len(ids)):
-                    if i != j and connections < max_connections:
-                        if random.random() < 0.7:  
-                            edges.append({
-                                "source": source_id,
-                                "target": ids[j],
-                                "relation": "semantic_similarity",
-                                "weight": 0.8
-                            })
+                    if connections >= max_connections:
+                        break
+                    if i != j:
+                        if rand() < 0.7:  
+                            edges.append((source_id, ids[j], "semantic_similarity", 0.8))
                             connections += 1
     
     print(f"Created {len(edges)} meaningful connections")
-    return edges
+    return [{"source": s, "target": t, "relation": r, "weight": w} for s, t, r, w in edges]
+
+def is_guidebook_entry(entry: Dict[str, Any]) -> bool:
+    return entry.get("type") == "guidebook_lesson" or "guidebook_" in entry.get("id", "")
+
+def example_lines(exs: Any, require_both: bool) -> List[str]:
+    """Format examples as "ja\nen" blocks, keeping those with both sides (or either side)."""
+    parts = []
+    for ex in exs:
+        if isinstance(ex, dict):
+            ja = str(ex.get("ja", "")).strip()
+            en = str(ex.get("en", "")).strip()
+            if (ja and en) if require_both else (ja or en):
+                parts.append(f"{ja}\n{en}")
+    return parts
+
+def build_guidebook_snippet(entry: Dict[str, Any], header: str) -> str:
+    """Header, complete examples, then a truncated tip, separated by blank lines."""
+    parts = [header] if header else []
+    parts.extend(example_lines(entry.get("examples") or (), require_both=True))
+    tips = entry.get("tips") or ""
+    if len(tips) > 10:
+        parts.append("💡 " + (tips[:200] + "..." if len(tips) > 200 else tips))
+    return "\n\n".join(parts)
+
+def build_example_snippet(entry: Dict[str, Any], fallbacks: Tuple[Any, ...]) -> Any:
+    """Examples joined by blank lines, else the first truthy fallback."""
+    content_snippet = "\n\n".join(example_lines(entry.get("examples") or (), require_both=False))
+    for fallback in fallbacks:
+        if content_snippet:
+            break
+        if fallback:
+            content_snippet = fallback
+    return content_snippet
 
 def main() -> None:
     grammar = load_json(DATA_CLEAN / "grammar_pattern.json")
@@ -230,153 +299,65 @@ def main() -> None:
 
     print(f"Loaded {len(grammar)} grammar patterns and {len(vocab)} vocabulary entries")
 
-    nodes: List[Dict[str, Any]] = []
+    nodes: List[Node] = []
     edges: List[Dict[str, Any]] = []
 
     # Create nodes
     for g in grammar:
-        content_snippet = ""
-        
-        if g.get("type") == "guidebook_lesson" or "guidebook_" in g.get("id", ""):
-            lesson_topic = g.get("description", "")
-            
-            if lesson_topic:
-                enriched_content = enrich_guidebook_content(lesson_topic)
-                content_snippet = enriched_content
-            
-            exs = g.get("examples", []) or []
-            if exs:
-                example_parts = []
-                for ex in exs:
-                    if isinstance(ex, dict):
-                        ja = str(ex.get("ja", "")).strip()
-                        en = str(ex.get("en", "")).strip()
-                        if ja and en:
-                            example_parts.append(f"{ja}\n{en}")
-                
-                if example_parts:
-                    if content_snippet:
-                        content_snippet += "\n\n"
-                    content_snippet += "\n\n".join(example_parts)
-            
-            if g.get("tips") and len(g.get("tips", "")) > 10:
-                if content_snippet:
-                    content_snippet += "\n\n💡 "
-                else:
-                    content_snippet = "💡 "
-                tips = g.get("tips", "")[:200]
-                if len(g.get("tips", "")) > 200:
-                    tips += "..."
-                content_snippet += tips
-        
+        if is_guidebook_entry(g):
+            description = g.get("description", "")
+            header = enrich_guidebook_content(description) if description else ""
+            content_snippet = build_guidebook_snippet(g, header)
         else:
-            exs = g.get("examples", []) or []
-            if exs:
-                example_parts = []
-                for ex in exs:
-                    if isinstance(ex, dict):
-                        ja = str(ex.get("ja", "")).strip()
-                        en = str(ex.get("en", "")).strip()
-                        if ja or en:
-                            example_parts.append(f"{ja}\n{en}")
-                
-                if example_parts:
-                    content_snippet = "\n\n".join(example_parts)
-            
-            if not content_snippet and g.get("description"):
-                content_snippet = g.get("description")
+            content_snippet = build_example_snippet(g, (g.get("description"),))
         
         level = g.get("level", 1)
         
         pos = g.get("pos", "Grammar")
         
-        nodes.append({
-            "id": g["id"],
-            "label": g.get("title_ja") or g.get("title") or g["id"],
-            "type": "grammar_pattern",
-            "pos": pos,
-            "level": level,
-            "difficulty": f"Level {level}",
-            "tags": g.get("tags", []),
-            "en": g.get("description", ""),
-            "ex": content_snippet,
-            "cluster_key": f"grammar_level_{level}"})
+        nodes.append(Node(
+            id=g["id"],
+            label=g.get("title_ja") or g.get("title") or g["id"],
+            type="grammar_pattern",
+            pos=pos,
+            level=level,
+            difficulty=f"Level {level}",
+            tags=g.get("tags", []),
+            en=g.get("description", ""),
+            ex=content_snippet,
+            cluster_key=f"grammar_level_{level}"))
 
     for v in vocab:
-        content_snippet = ""
-        
-        if v.get("type") == "guidebook_lesson" or "guidebook_" in v.get("id", ""):
-            if v.get("description"):
-                content_snippet = f"📚 {v.get('description')}"
-            
-            v_exs = v.get("examples", []) or []
-            if v_exs:
-                example_parts = []
-                for ex in v_exs:
-                    if isinstance(ex, dict):
-                        ja = str(ex.get("ja", "")).strip()
-                        en = str(ex.get("en", "")).strip()
-                        if ja and en:
-                            example_parts.append(f"{ja}\n{en}")
-                
-                if example_parts:
-                    if content_snippet:
-                        content_snippet += "\n\n"
-                    content_snippet += "\n\n".join(example_parts)
-            
-            if v.get("tips") and len(v.get("tips", "")) > 10:
-                if content_snippet:
-                    content_snippet += "\n\n💡 "
-                else:
-                    content_snippet = "💡 "
-                tips = v.get("tips", "")[:200]
-                if len(v.get("tips", "")) > 200:
-                    tips += "..."
-                content_snippet += tips
-        
+        description = v.get("description")
+        if is_guidebook_entry(v):
+            content_snippet = build_guidebook_snippet(v, f"📚 {description}" if description else "")
         else:
-            v_exs = v.get("examples", []) or []
-            if v_exs:
-                example_parts = []
-                for ex in v_exs:
-                    if isinstance(ex, dict):
-                        ja = str(ex.get("ja", "")).strip()
-                        en = str(ex.get("en", "")).strip()
-                        if ja or en:
-                            example_parts.append(f"{ja}\n{en}")
-                
-                if example_parts:
-                    content_snippet = "\n\n".join(example_parts)
-            
-            if not content_snippet and v.get("meaning"):
-                content_snippet = f"Meaning: {v.get('meaning')}"
-            
-            if not content_snippet and v.get("description"):
-                content_snippet = v.get("description")
+            meaning = v.get("meaning")
+            content_snippet = build_example_snippet(v, (meaning and f"Meaning: {meaning}", description))
         
         level = v.get("level", 1)
         pos = v.get("pos", "unknown")
         
-        nodes.append({
-            "id": v["id"],
-            "label": v.get("lemma", v["id"]),
-            "type": "vocabulary_entry",
-            "pos": pos,
-            "level": level,
-            "difficulty": f"Level {level}",
-            "tags": v.get("tags", []),
-            "en": ", ".join([m for m in v.get("meanings", []) if isinstance(m, str)])[:240],
-            "ex": content_snippet,
-            "cluster_key": f"vocab_level_{level}_{pos}"
-        })
+        nodes.append(Node(
+            id=v["id"],
+            label=v.get("lemma", v["id"]),
+            type="vocabulary_entry",
+            pos=pos,
+            level=level,
+            difficulty=f"Level {level}",
+            tags=v.get("tags", []),
+            en=", ".join([m for m in v.get("meanings", []) if isinstance(m, str)])[:240],
+            ex=content_snippet,
+            cluster_key=f"vocab_level_{level}_{pos}"
+        ))
 
     # Create edges
     edges = create_meaningful_edges(vocab, grammar)
     
     print(f"Created {len(edges)} edges")
 
-    (OUT_DIR / "nodes.json").write_text(json.dumps(nodes, ensure_ascii=False, indent=2), encoding="utf-8")
-    (OUT_DIR / "edges.json").write_text(json.dumps(edges, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json(OUT_DIR / "nodes.json", nodes)
+    write_json(OUT_DIR / "edges.json", edges)
 
     print(f"Wrote {len(nodes)} nodes and {len(edges)} edges to {OUT_DIR}")
     
@@ -384,9 +365,9 @@ def main() -> None:
     pos_counts = defaultdict(int)
     
     for n in nodes:
-        level_counts[n["level"]] += 1
-        if n["type"] == "vocabulary_entry":
-            pos_counts[n["pos"]] += 1
+        level_counts[n.level] += 1
+        if n.type == "vocabulary_entry":
+            pos_counts[n.pos] += 1
     
     print("\nNode distribution:")
     print("Difficulty levels:", dict(level_counts))
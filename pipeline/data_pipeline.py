@@ -1,16 +1,65 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import hashlib
+from itertools import islice
 import json
 from pathlib import Path
 import re
 from typing import Any, Dict, Iterable, List, Tuple
 from jsonschema import Draft202012Validator
 import spacy
-nlp = spacy.load("ja_ginza")
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+GINZA_MODEL = "ja_ginza"
+_nlp = None
+
+
+def get_nlp():
+    """Load Ginza on first use; runs that never need a POS guess skip the model load entirely."""
+    global _nlp
+    if _nlp is None:
+        # Only the morphologizer (and its tok2vec) feed token.pos_; skip the rest of the pipeline
+        _nlp = spacy.load(GINZA_MODEL, disable=["parser", "ner", "compound_splitter", "bunsetu_recognizer"])
+    return _nlp
+
+
+# Regexes used on every row, compiled once
+COUNTER_RE = re.compile(r"^[一二三四五六七八九十百千万億]+[人本枚冊円個台匹頭羽杯着足軒階時間分秒日月年週間]")
+# ァ..ヶ plus the long-vowel mark; str.strip with this set is a cheaper "katakana only" test than a regex
+KATAKANA_CHARS = "".join(map(chr, range(ord("ァ"), ord("ヶ") + 1))) + "ー"
+# "1.2) " and/or "IV. " list markers; the roman part may follow a stripped number
+LIST_PREFIX_RE = re.compile(r"^(?:\s*\d+(?:\.\d+)*(?:[)\.])?\s+)?(?:\s*[IVXLCM]+\.\s+)?", re.IGNORECASE)
+NUM_PREFIX_LOOSE_RE = re.compile(r"^\s*\d+(?:\.\d+)*(?:[)\.])?\s*")
+NUM_DOT_RE = re.compile(r"^\d+\.\s*")
+LATIN_RE = re.compile(r"[A-Za-z]")
+JAPANESE_RE = re.compile(r"[\u3040-\u30FF\u4E00-\u9FFF]")
+LATIN_TOKENS_RE = re.compile(r"[a-z]+")
+ROMAJI_PARTICLES_RE = re.compile(r"\b(wa|ga|o|ni|de|kara|made|to|ya|mo|ka|desu|masu|nai|suru|kuru|iku)\b")
+GUIDEBOOK_UNIT_RE = re.compile(r"^Section \d+ Unit \d+$")
 
 # POS helpers 
+def _memoize_text(fn):
+    """lru_cache keyed on a str first argument; other (possibly unhashable) inputs bypass the cache."""
+    cached = functools.lru_cache(maxsize=200_000)(fn)
+
+    @functools.wraps(fn)
+    def wrapper(text, *args):
+        if isinstance(text, str):
+            return cached(text, *args)
+        return fn(text, *args)
+
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
 CANON_POS = {
     "noun": "Noun",
     "n": "Noun",
@@ -31,6 +80,7 @@ CANON_POS = {
     "kanji": "Noun",
     "katakana": "Noun"}
 
+@_memoize_text
 def normalize_pos_label(pos_raw: str | None) -> str:
     if not pos_raw:
         return ""
@@ -55,36 +105,93 @@ def normalize_pos_label(pos_raw: str | None) -> str:
         return "Noun"
     return pos_raw 
 
+def _upos_to_label(doc) -> str:
+    token = next((t for t in doc if t.pos_ not in {"PUNCT", "SPACE"}), None)
+    if not token:
+        return ""
+    upos = token.pos_  
+    if upos in {"NOUN", "PROPN"}:
+        return "Noun"
+    if upos in {"VERB", "AUX"}:
+        return "Verb"
+    if upos == "ADJ":
+        return "Adjective"
+    if upos == "ADV":
+        return "Adverb"
+    if upos == "PRON":
+        return "Pronoun"
+    if upos in {"ADP", "PART"}:
+        return "Particle"
+    if upos in {"SCONJ", "CCONJ"}:
+        return "Conjunction"
+    if upos == "NUM":
+        return "Counter"
+    return "Expression"
+
+
+# Ginza labels by exact text; persisted between runs by load_pos_cache/save_pos_cache
+GINZA_POS_CACHE: Dict[str, str] = {}
+
+
 def derive_pos_with_ginza(text: str) -> str:
     if not isinstance(text, str) or not text.strip():
         return ""
+    label = GINZA_POS_CACHE.get(text)
+    if label is None:
+        try:
+            label = _upos_to_label(get_nlp()(text))
+        except Exception:
+            label = ""
+        GINZA_POS_CACHE[text] = label
+    return label
+
+
+def derive_pos_batch(texts: Iterable[Any]) -> Dict[str, str]:
+    """Ginza POS labels for many texts in one nlp.pipe pass; keyed by text (deduplicated)."""
+    wanted = list(dict.fromkeys(t for t in texts if isinstance(t, str) and t.strip()))
+    todo = [t for t in wanted if t not in GINZA_POS_CACHE]
+    if todo:
+        try:
+            GINZA_POS_CACHE.update((t, _upos_to_label(doc)) for t, doc in zip(todo, get_nlp().pipe(todo, batch_size=1000)))
+        except Exception:
+            for t in todo:
+                derive_pos_with_ginza(t)
+    return {t: GINZA_POS_CACHE[t] for t in wanted}
+
+
+def _ginza_model_key() -> str:
+    # Read from the installed package so checking the cache does not load the model
+    return f"{GINZA_MODEL}-{spacy.util.get_package_version(GINZA_MODEL)}"
+
+
+def load_pos_cache(path: Path) -> None:
+    """Prime GINZA_POS_CACHE from disk if it was written by the same Ginza model."""
     try:
-        doc = nlp(text)
-        token = next((t for t in doc if t.pos_ not in {"PUNCT", "SPACE"}), None)
-        if not token:
-            return ""
-        upos = token.pos_  
-        if upos in {"NOUN", "PROPN"}:
-            return "Noun"
-        if upos in {"VERB", "AUX"}:
-            return "Verb"
-        if upos == "ADJ":
-            return "Adjective"
-        if upos == "ADV":
-            return "Adverb"
-        if upos == "PRON":
-            return "Pronoun"
-        if upos in {"ADP", "PART"}:
-            return "Particle"
-        if upos in {"SCONJ", "CCONJ"}:
-            return "Conjunction"
-        if upos == "NUM":
-            return "Counter"
-        return "Expression"
-    except Exception:
-        return ""
+        cached = load_json(path)
+    except ValueError:
+        return
+    if isinstance(cached, dict) and cached.get("model") == _ginza_model_key():
+        GINZA_POS_CACHE.update(cached.get("labels") or {})
+
 
+def save_pos_cache(path: Path) -> None:
+    write_json(path, {"model": _ginza_model_key(), "labels": GINZA_POS_CACHE})
 
+
+RULE_PARTICLES = frozenset({"は", "が", "を", "に", "で", "へ", "の", "より", "って", "という", "など", "しか", "こそ", "さえ", "でも", "ばかり", "だけ", "ほど", "くらい"})
+
+RULE_CONJUNCTIONS = frozenset({"と", "から", "まで", "や", "も", "か", "し", "が", "けれど", "のに", "ので", "ば", "たら", "なら"})
+
+# A tuple so str.endswith can test every suffix in one call
+RULE_COUNTER_SUFFIXES = ("人", "本", "枚", "冊", "円", "個", "台", "匹", "頭", "羽", "杯", "着", "足", "軒", "階", "時間", "分", "秒", "日", "月", "年", "週間", "分間", "秒間")
+
+RULE_SPECIFIC_COUNTERS = frozenset({"一つ", "二つ", "三つ", "四つ", "五つ", "六つ", "七つ", "八つ", "九つ", "十",
+                                    "一人", "二人", "三人", "四人", "五人", "六人", "七人", "八人", "九人", "十人",
+                                    "一本", "二本", "三本", "四本", "五本", "六本", "七本", "八本", "九本", "十本",
+                                    "一枚", "二枚", "三枚", "四枚", "五枚", "六枚", "七枚", "八枚", "九枚", "十枚"})
+
+
+@_memoize_text
 def supplement_pos_with_rules(text: str, current_pos: str = "") -> str:
     """Supplement POS using rule-based patterns when Ginza is unavailable or uncertain."""
     if not isinstance(text, str) or not text.strip():
@@ -92,32 +199,22 @@ def supplement_pos_with_rules(text: str, current_pos: str = "") -> str:
     
     text = text.strip()
     
-    particles = {"は", "が", "を", "に", "で", "へ", "の", "より", "って", "という", "など", "しか", "こそ", "さえ", "でも", "ばかり", "だけ", "ほど", "くらい"}
-    
-    conjunctions = {"と", "から", "まで", "や", "も", "か", "し", "が", "けれど", "のに", "ので", "ば", "たら", "なら"}
-    
-    counters = {"人", "本", "枚", "冊", "円", "個", "台", "匹", "頭", "羽", "杯", "着", "足", "軒", "階", "時間", "分", "秒", "日", "月", "年", "週間", "時間", "分間", "秒間"}
-    
-    if text in particles:
+    if text in RULE_PARTICLES:
         return "Particle"
     
-    if text in conjunctions:
+    if text in RULE_CONJUNCTIONS:
         return "Conjunction"
     
-    if any(text.endswith(counter) for counter in counters):
+    if text.endswith(RULE_COUNTER_SUFFIXES):
         return "Counter"
     
-    specific_counters = {"一つ", "二つ", "三つ", "四つ", "五つ", "六つ", "七つ", "八つ", "九つ", "十",
-                        "一人", "二人", "三人", "四人", "五人", "六人", "七人", "八人", "九人", "十人",
-                        "一本", "二本", "三本", "四本", "五本", "六本", "七本", "八本", "九本", "十本",
-                        "一枚", "二枚", "三枚", "四枚", "五枚", "六枚", "七枚", "八枚", "九枚", "十枚"}
-    if text in specific_counters:
+    if text in RULE_SPECIFIC_COUNTERS:
         return "Counter"
     
-    if re.match(r"^[一二三四五六七八九十百千万億]+[人本枚冊円個台匹頭羽杯着足軒階時間分秒日月年週間]", text):
+    if COUNTER_RE.match(text):
         return "Counter"
     
-    if re.match(r"^[ァ-ヶー]+$", text):
+    if not text.strip(KATAKANA_CHARS):
         return "Noun"
     
     if text.endswith(("する", "れる", "られる", "せる", "させる")):
@@ -142,18 +239,49 @@ SCHEMAS = ROOT / "schemas"
 def load_json(path: Path) -> Any:
     if not path.exists():
         return None
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def write_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if not isinstance(data, list) or not data:
+            path.write_bytes(orjson.dumps(data, option=option))
+            return
+        # Serialise one record at a time, re-indented one level, so the bytes match a whole-list dump
+        with path.open("wb") as f:
+            sep = b"[\n  "
+            for item in data:
+                f.write(sep)
+                f.write(orjson.dumps(item, option=option).replace(b"\n", b"\n  "))
+                sep = b",\n  "
+            f.write(b"\n]")
+        return
+    # json.dump already streams its encoder chunks to the file
     with path.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def stable_id(prefix: str, payload: Dict[str, Any]) -> str:
-    h = hashlib.md5(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+def write_ndjson(path: Path, items: Iterable[Dict[str, Any]]) -> None:
+    """One compact JSON object per line, for line-oriented downstream readers."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        for item in items:
+            if orjson is not None:
+                f.write(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                f.write(json.dumps(item, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def stable_id(prefix: str, payload: Dict[str, Any] | str) -> str:
+    """Short content hash; a str payload is hashed as-is, a dict via its sorted-key JSON form."""
+    if not isinstance(payload, str):
+        payload = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    h = hashlib.blake2b(payload.encode("utf-8"), digest_size=4).hexdigest()
     return f"{prefix}_{h}"
 
 
@@ -176,6 +304,9 @@ def ensure_list_strings(value: Any) -> List[str]:
     if not value:
         return []
     if isinstance(value, list):
+        # Tag/meaning lists are nearly always plain str already: copy them without per-item str()
+        if set(map(type, value)) == {str}:
+            return value[:]
         return [str(v) for v in value if isinstance(v, (str, int, float))]
     return [str(value)]
 
@@ -183,14 +314,11 @@ def ensure_list_strings(value: Any) -> List[str]:
 def strip_leading_numbering(text: Any) -> str:
     if not isinstance(text, str):
         return text or ""
-    s = text.strip()
-    s = re.sub(r"^\s*\d+(?:\.\d+)*(?:[)\.])?\s+", "", s)
-    s = re.sub(r"^\s*[IVXLCM]+\.[\s]+", "", s, flags=re.IGNORECASE)
-    return s
+    return LIST_PREFIX_RE.sub("", text.strip(), count=1)
 
 
 def contains_latin_letters(text: str) -> bool:
-    return bool(isinstance(text, str) and re.search(r"[A-Za-z]", text))
+    return bool(isinstance(text, str) and LATIN_RE.search(text))
 
 
 def split_examples_pipe(examples: List[Dict[str, str]]) -> List[Dict[str, str]]:
@@ -210,42 +338,53 @@ def split_examples_pipe(examples: List[Dict[str, str]]) -> List[Dict[str, str]]:
     return out
 
 
+# Literal markers in priority order: the first one found in the examples wins
+CONCEPT_PATTERNS: List[Tuple[str, str]] = [
+    ("てよかった", "てよかった"),
+    ("てくれる", "てくれる"),
+    ("てもらえる", "てもらえる"),
+    ("てもらえませんか", "てもらえませんか"),
+    ("てあげる", "てあげる"),
+    ("てみる", "てみる"),
+    ("やすい", "〜やすい"),
+    ("にくい", "〜にくい"),
+    ("なければならない", "なければならない"),
+    ("なければいけない", "なければいけない"),
+    ("かもしれない", "かもしれない"),
+    ("ように", "ように"),
+    ("ために", "ために"),
+    ("ところ", "ところ"),
+    ("ことができる", "ことができる"),
+    ("てはいけない", "てはいけない"),
+    ("なさい", "〜なさい"),
+    ("ばかり", "〜ばかり"),
+    ("だけ", "〜だけ"),
+]
+# One scan finds some marker; only markers ranked above it need a second look
+CONCEPT_RE = re.compile("|".join(f"(?P<c{i}>{re.escape(marker)})" for i, (marker, _) in enumerate(CONCEPT_PATTERNS)))
+
+
 def detect_concept_from_examples(examples: List[Dict[str, str]]) -> str | None:
     """Heuristically detect a Japanese grammar concept from example JA strings."""
     if not examples:
         return None
     text = "\n".join(ex.get("ja") or "" for ex in examples)
-    patterns: List[Tuple[str, str]] = [
-        (r"てよかった", "てよかった"),
-        (r"てくれる", "てくれる"),
-        (r"てもらえる", "てもらえる"),
-        (r"てもらえませんか", "てもらえませんか"),
-        (r"てあげる", "てあげる"),
-        (r"てみる", "てみる"),
-        (r"やすい", "〜やすい"),
-        (r"にくい", "〜にくい"),
-        (r"なければならない", "なければならない"),
-        (r"なければいけない", "なければいけない"),
-        (r"かもしれない", "かもしれない"),
-        (r"ように", "ように"),
-        (r"ために", "ために"),
-        (r"ところ", "ところ"),
-        (r"ことができる", "ことができる"),
-        (r"てはいけない", "てはいけない"),
-        (r"なさい", "〜なさい"),
-        (r"ばかり", "〜ばかり"),
-        (r"だけ", "〜だけ"),
-]
-    for regex, concept in patterns:
-        if re.search(regex, text):
+    m = CONCEPT_RE.search(text)
+    if not m:
+        return None
+    found = int(m.lastgroup[1:])
+    for marker, concept in CONCEPT_PATTERNS[:found]:
+        if marker in text:
             return concept
-    return None
+    return CONCEPT_PATTERNS[found][1]
 
 
 def has_japanese_chars(text: str) -> bool:
     if not isinstance(text, str):
         return False
-    return bool(re.search(r"[\u3040-\u30FF\u4E00-\u9FFF]", text))
+    if text.isascii():
+        return False
+    return bool(JAPANESE_RE.search(text))
 
 
 def looks_like_romaji(text: str) -> bool:
@@ -260,13 +399,13 @@ def looks_like_romaji(text: str) -> bool:
         "shiranai", "aida", "neteita", "kotoshi", "natsuyasumi", "dou", "nasaru", "tsumori"
     ]
     if contains_latin_letters(t):
-        tokens = re.findall(r"[a-z]+", t)
+        tokens = LATIN_TOKENS_RE.findall(t)
         if tokens and sum(1 for tok in tokens if tok in romaji_tokens) >= max(1, len(tokens)//4):
             return True
         eng_markers = ["the", "and", "is", "are", "was", "were", "have", "has", "had", "to ", "for ", "with "]
         if not any(m in t for m in eng_markers) and t == t.lower():
             return True
-        if re.search(r"\b(wa|ga|o|ni|de|kara|made|to|ya|mo|ka|desu|masu|nai|suru|kuru|iku)\b", t):
+        if ROMAJI_PARTICLES_RE.search(t):
             return True
     return False
 
@@ -274,9 +413,22 @@ def looks_like_romaji(text: str) -> bool:
 
 
 
+def resolve_pos(raw_pos: Any, lemma: Any, reading: Any = "") -> Any:
+    """Source label, else Ginza on the lemma then the reading, else the rule layer on the lemma."""
+    # Rules always answer (at worst "Expression"), so they are the last resort, after Ginza
+    return (
+        normalize_pos_label(raw_pos)
+        or derive_pos_with_ginza(lemma)
+        or derive_pos_with_ginza(reading)
+        or supplement_pos_with_rules(lemma)
+    )
+
+
 # Schema validation 
 
 def load_validator(schema_file: str) -> Draft202012Validator:
+    # Construction is cheap (well under a millisecond; jsonschema resolves lazily), so validators are
+    # built once per process and kept in the module globals below rather than persisted to disk
     schema = load_json(SCHEMAS / schema_file)
     if not isinstance(schema, dict):
         raise RuntimeError(f"Schema not found or invalid: {schema_file}")
@@ -285,6 +437,20 @@ def load_validator(schema_file: str) -> Draft202012Validator:
 
 GRAMMAR_VALIDATOR = None  
 VOCAB_VALIDATOR = None 
+# validate_item results by content digest: repeated identical rows are only validated once
+VALIDATION_RESULTS: Dict[bytes, Tuple[bool, List[str]]] = {}
+
+
+def content_digest(item: Dict[str, Any]) -> bytes | None:
+    """Digest of an item's canonical (sorted-key) JSON form; None if it cannot be serialised."""
+    try:
+        if orjson is not None:
+            data = orjson.dumps(item, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(item, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 def validate_item(item: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -292,19 +458,78 @@ def validate_item(item: Dict[str, Any]) -> Tuple[bool, List[str]]:
     if item.get("type") == "grammar_pattern":
         if GRAMMAR_VALIDATOR is None:
             GRAMMAR_VALIDATOR = load_validator("grammar_pattern.schema.json")
-        errors = sorted(GRAMMAR_VALIDATOR.iter_errors(item), key=lambda e: e.path)
+        validator = GRAMMAR_VALIDATOR
     elif item.get("type") == "vocabulary_entry":
         if VOCAB_VALIDATOR is None:
             VOCAB_VALIDATOR = load_validator("vocabulary_entry.schema.json")
-        errors = sorted(VOCAB_VALIDATOR.iter_errors(item), key=lambda e: e.path)
+        validator = VOCAB_VALIDATOR
     else:
         return False, ["Unknown type: " + str(item.get("type"))]
-    msgs = [f"{list(e.path)}: {e.message}" for e in errors]
-    return (len(msgs) == 0), msgs
+    key = content_digest(item)
+    if key is not None and key in VALIDATION_RESULTS:
+        return VALIDATION_RESULTS[key]
+    # Most items are valid: stop at the first error and only collect/sort messages for failures
+    if validator.is_valid(item):
+        result: Tuple[bool, List[str]] = (True, [])
+    else:
+        errors = sorted(validator.iter_errors(item), key=lambda e: e.path)
+        msgs = [f"{list(e.path)}: {e.message}" for e in errors]
+        result = ((len(msgs) == 0), msgs)
+    if key is not None:
+        VALIDATION_RESULTS[key] = result
+    return result
 
 
 # Per source cleaners
 
+# Per-item skip/invalid messages, printed in one write by flush_warnings() instead of one print per row
+WARNINGS: List[str] = []
+
+
+def flush_warnings() -> None:
+    if WARNINGS:
+        print("\n".join(WARNINGS))
+        WARNINGS.clear()
+
+
+# Example sentences ending like this are cut-off fragments rather than full sentences
+FRAGMENT_SUFFIXES = (
+    "った", "ったこと", "ったことが", "ったことがある", "ったことがあります",
+    "し", "って", "こと", "の", "ながら", "らしい", "さすが", "間に", "つもり", "でも", "は", "が", "を", "に", "で",
+)
+
+
+def ingest_jlpt_examples(raw_examples: Any, title: str) -> List[Dict[str, str]]:
+    """to_examples plus the JLPT fragment/translation clean-up, in one pass over the raw examples."""
+    examples: List[Dict[str, str]] = []
+    if not isinstance(raw_examples, list):
+        return examples
+    for ex in raw_examples:
+        if isinstance(ex, dict):
+            ja = ex.get("ja") or ex.get("japanese") or ex.get("jp") or ""
+            en = ex.get("en") or ex.get("english") or ""
+            if not isinstance(ja, str) or not ja.strip():
+                continue
+            ja = ja.strip()
+            en = (en or "").strip()
+        elif isinstance(ex, str) and ex.strip():
+            ja = ex.strip()
+            en = ""
+        else:
+            continue
+
+        if title and ((ja in title and len(ja) < len(title) * 0.6) or ja.endswith(FRAGMENT_SUFFIXES)):
+            continue
+        if en.startswith("Translation of: "):
+            en = en.replace("Translation of: ", "").strip()
+        if looks_like_romaji(en) or en == ja or en.strip().lower() in {"grammar pattern", "- meaning needed", "nan"}:
+            en = ""
+
+        if ja != title:
+            examples.append({"ja": ja, "en": en})
+    return examples
+
+
 def clean_jlpt(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
     grammar: List[Dict[str, Any]] = []
     vocab: List[Dict[str, Any]] = []
@@ -316,7 +541,7 @@ def clean_jlpt(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Li
         if not isinstance(r, dict):
             continue
 
-        item_id = str(r.get("id") or stable_id("jlpt", {"t": r.get("title"), "m": r.get("meaning")}))
+        item_id = str(r.get("id") or stable_id("jlpt", f"{r.get('title') or ''}\x1f{r.get('meaning') or ''}"))
         title_raw = r.get("title") or r.get("title_ja") or r.get("label") or r.get("jp") or ""
         description_raw = r.get("meaning") or r.get("description") or ""
         usage_raw = r.get("usage") or ""
@@ -325,44 +550,20 @@ def clean_jlpt(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Li
         usage = strip_leading_numbering(usage_raw)
         jlpt_level = r.get("jlpt_level") or r.get("level") or ""
         tags = ensure_list_strings(r.get("tags"))
-        examples = to_examples(r.get("examples") or [])
+        examples = ingest_jlpt_examples(r.get("examples") or [], title)
         if usage and usage != "nan" and contains_latin_letters(usage) and not looks_like_romaji(usage):
             description = usage
         elif description and description.strip() == title.strip():
             description = ""
-        elif description and re.match(r"^\d+\.\s*", description.strip()):
-            clean_meaning = re.sub(r"^\d+\.\s*", "", description.strip())
+        elif description and NUM_DOT_RE.match(description.strip()):
+            clean_meaning = NUM_DOT_RE.sub("", description.strip())
             if clean_meaning == title.strip():
                 description = ""
             else:
                 description = clean_meaning
-        if examples:
-            cleaned: List[Dict[str, str]] = []
-            for ex in examples:
-                ja = (ex.get("ja") or "").strip()
-                en = (ex.get("en") or "").strip()
-
-                is_fragment = False
-                if ja and title:
-                    if ja in title and len(ja) < len(title) * 0.6:
-                        is_fragment = True
-                    if ja.endswith(("った", "ったこと", "ったことが", "ったことがある", "ったことがあります")):
-                        is_fragment = True
-                    if any(ja.endswith(p) for p in ["し", "って", "こと", "の", "ながら", "らしい", "さすが", "間に", "つもり", "でも", "は", "が", "を", "に", "で"]):
-                        is_fragment = True
-                if is_fragment:
-                    continue 
-                if en.startswith("Translation of: "):
-                    en = en.replace("Translation of: ", "").strip()
-                if looks_like_romaji(en) or en == ja or en.strip().lower() in {"grammar pattern", "- meaning needed", "nan"}:
-                    en = ""
-
-                if ja and (not title or ja != title):
-                    cleaned.append({"ja": ja, "en": en})
-            examples = cleaned
 
         desc_is_dup = description.strip() == title.strip() or description.strip().startswith(title.strip())
-        desc_is_numbered_dup = re.sub(r"^\s*\d+(?:\.\d+)*(?:[)\.])?\s*", "", description.strip()) == title.strip()
+        desc_is_numbered_dup = NUM_PREFIX_LOOSE_RE.sub("", description.strip()) == title.strip()
         desc_is_placeholder = description.strip().lower() in {"grammar pattern", "- meaning needed"}
 
         if not description or has_japanese_chars(description) or desc_is_dup or desc_is_numbered_dup or desc_is_placeholder:
@@ -454,6 +655,8 @@ def clean_duolingo(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]
     if not isinstance(raw, list):
         return grammar, vocab
 
+    # First pass: build items; vocab POS is filled in after one batched Ginza run
+    pending: List[Tuple[Dict[str, Any], str]] = []
     for r in raw:
         if not isinstance(r, dict):
             continue
@@ -464,7 +667,7 @@ def clean_duolingo(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]
         if str(r.get("id", "")).startswith("guidebook_") or r.get("examples"):
             if title and title.lower() in ["section", "unit", "lesson", "guidebook"]:
                 continue
-            if title and re.match(r"^Section \d+ Unit \d+$", title):
+            if title and GUIDEBOOK_UNIT_RE.match(title):
                 continue
             if not meaning or len(meaning.strip()) < 3:
                 continue
@@ -482,34 +685,44 @@ def clean_duolingo(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]
                 "relations": [],
                 "embedding": None,
             }
-            ok, errs = validate_item(g)
-            if ok:
-                grammar.append(g)
-            else:
-                print(f"Skipping invalid Duolingo grammar {rid}: {errs[:2]}")
+            pending.append((g, ""))
         else:
             lemma = r.get("lemma") or title
             if not lemma or not meaning:
                 continue
             raw_pos = str(r.get("pos") or r.get("type") or "")
-            pos_norm = normalize_pos_label(raw_pos) or derive_pos_with_ginza(lemma) or supplement_pos_with_rules(lemma)
             v = {
                 "id": rid,
                 "type": "vocabulary_entry",
                 "lemma": str(lemma),
                 "reading": str(r.get("reading") or ""),
-                "pos": pos_norm or raw_pos,
+                "pos": raw_pos,
                 "meanings": ensure_list_strings(r.get("meanings") or (meaning and [meaning] or [])),
                 "examples": to_examples(r.get("examples") or []),
                 "tags": list({*ensure_list_strings(r.get("tags")), "duolingo"}),
                 "relations": [],
                 "embedding": None,
             }
-            ok, errs = validate_item(v)
+            pending.append((v, lemma))
+
+    # Tag every lemma lacking a usable POS label in one Ginza batch; resolve_pos then reads the cache
+    derive_pos_batch(lemma for v, lemma in pending if lemma and not normalize_pos_label(v["pos"]))
+
+    # Second pass: resolve POS and validate, in input order
+    for item, lemma in pending:
+        if item["type"] == "grammar_pattern":
+            ok, errs = validate_item(item)
             if ok:
-                vocab.append(v)
+                grammar.append(item)
             else:
-                print(f"Skipping invalid Duolingo vocab {rid}: {errs[:2]}")
+                WARNINGS.append(f"Skipping invalid Duolingo grammar {item['id']}: {errs[:2]}")
+            continue
+        item["pos"] = resolve_pos(item["pos"], lemma)
+        ok, errs = validate_item(item)
+        if ok:
+            vocab.append(item)
+        else:
+            WARNINGS.append(f"Skipping invalid Duolingo vocab {item['id']}: {errs[:2]}")
 
     return grammar, vocab
 
@@ -520,6 +733,8 @@ def clean_anki(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     if not isinstance(raw, list):
         return grammar, vocab
 
+    # First pass: build items; POS is filled in after batched Ginza runs
+    pending: List[Tuple[Dict[str, Any], Any, Any, Any]] = []
     for r in raw:
         if not isinstance(r, dict):
             continue
@@ -545,25 +760,33 @@ def clean_anki(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
                 if ja:
                     examples.append({"ja": ja, "en": en})
         
-        pos_norm = normalize_pos_label(pos) or derive_pos_with_ginza(lemma) or derive_pos_with_ginza(reading) or supplement_pos_with_rules(lemma) or supplement_pos_with_rules(reading)
-        
         v = {
             "id": rid,
             "type": "vocabulary_entry",
             "lemma": str(lemma),
             "reading": str(reading),
-            "pos": str(pos_norm or pos),
+            "pos": "",
             "meanings": meanings,
             "examples": examples,
             "tags": list({*ensure_list_strings(r.get("tags")), "anki"}),
             "relations": [],
             "embedding": None,
         }
+        pending.append((v, lemma, reading, pos))
+
+    # Ginza runs in two batches: lemmas lacking a usable POS label, then readings where that failed
+    need = [(lemma, reading) for _, lemma, reading, pos in pending if not normalize_pos_label(pos)]
+    lemma_pos = derive_pos_batch(lemma for lemma, _ in need)
+    derive_pos_batch(reading for lemma, reading in need if not lemma_pos.get(lemma))
+
+    # Second pass: resolve POS and validate, in input order
+    for v, lemma, reading, pos in pending:
+        v["pos"] = str(resolve_pos(pos, lemma, reading))
         ok, errs = validate_item(v)
         if ok:
             vocab.append(v)
         else:
-            print(f"Skipping invalid Anki vocab {rid}: {errs[:2]}")
+            WARNINGS.append(f"Skipping invalid Anki vocab {v['id']}: {errs[:2]}")
 
     return grammar, vocab
 
@@ -572,7 +795,38 @@ def clean_anki(raw: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
 
 
 # Deduplicattion & merge 
+def _clean_chunk(cleaner, rows: List[Any]) -> Tuple[Tuple[List[Dict[str, Any]], ...], List[str], Dict[str, str]]:
+    """Worker side of run_cleaner: the cleaner's lists plus the warnings and Ginza labels it produced."""
+    WARNINGS.clear()
+    start = len(GINZA_POS_CACHE)
+    result = cleaner(rows)
+    return result, WARNINGS[:], dict(islice(GINZA_POS_CACHE.items(), start, None))
+
+
+def run_cleaner(cleaner, raw: Any, workers: int = 1, pos_cache_path: Path | None = None) -> Tuple[List[Dict[str, Any]], ...]:
+    """Run a per-source cleaner, optionally over contiguous row chunks in a process pool.
+
+    Rows are cleaned independently, so concatenating the chunk results in order gives the
+    same entries as a single call; worker warnings and new Ginza labels are merged back.
+    """
+    if workers <= 1 or not isinstance(raw, list) or len(raw) < 2 * workers:
+        return cleaner(raw)
+    size = -(-len(raw) // workers)
+    chunks = [raw[i:i + size] for i in range(0, len(raw), size)]
+    initargs = (pos_cache_path,) if pos_cache_path is not None else ()
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_pos_cache if initargs else None, initargs=initargs) as pool:
+        parts = list(pool.map(_clean_chunk, [cleaner] * len(chunks), chunks))
+    merged: Tuple[List[Dict[str, Any]], ...] = tuple([] for _ in parts[0][0])
+    for result, warnings, labels in parts:
+        for acc, items in zip(merged, result):
+            acc.extend(items)
+        WARNINGS.extend(warnings)
+        GINZA_POS_CACHE.update(labels)
+    return merged
+
+
 def merge_by_id(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep the first item seen for each str id, in first-seen order (earlier sources win)."""
     by_id: Dict[str, Dict[str, Any]] = {}
     for it in items:
         iid = it.get("id")
@@ -586,11 +840,20 @@ def merge_by_id(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
 # Main 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Clean raw data into schema-compliant JSON files")
+    parser.add_argument("--strict", action="store_true", help="Re-validate entries the source cleaners already validated")
+    parser.add_argument("--ndjson", action="store_true", help="Also write grammar_pattern.ndjson and vocabulary_entry.ndjson")
+    parser.add_argument("--workers", type=int, default=1, help="Clean each source in N processes (pays off when many entries need Ginza)")
     args = parser.parse_args()
 
     grammar_all: List[Dict[str, Any]] = []
     vocab_all: List[Dict[str, Any]] = []
     dropped_entries: List[Dict[str, Any]] = []
+    # id() of entries that already passed validate_item inside a cleaner
+    validated: set[int] = set()
+
+    pos_cache_path = DATA_CLEAN / ".pos_cache.json"
+    load_pos_cache(pos_cache_path)
+    pos_cache_size = len(GINZA_POS_CACHE)
 
     # Load unified JLPT JSON
     jlpt_json = load_json(DATA_RAW / "jlpt_raw.json")
@@ -606,10 +869,11 @@ def main() -> None:
         # Fallback to individual JLPT data if unified format not available
         jlpt_raw = load_json(DATA_RAW / "jlpt_raw.json")
         if jlpt_raw is not None:
-            g, v, d = clean_jlpt(jlpt_raw)
+            g, v, d = run_cleaner(clean_jlpt, jlpt_raw, args.workers, pos_cache_path)
             grammar_all.extend(g)
             vocab_all.extend(v)
             dropped_entries.extend(d)
+            validated.update(map(id, g + v))
 
     # Load other sources
     duo_raw = load_json(DATA_RAW / "duo_raw.json")
@@ -617,33 +881,42 @@ def main() -> None:
 
     # Clean each source
     if duo_raw is not None:
-        g, v = clean_duolingo(duo_raw)
+        g, v = run_cleaner(clean_duolingo, duo_raw, args.workers, pos_cache_path)
         grammar_all.extend(g)
         vocab_all.extend(v)
+        validated.update(map(id, g + v))
 
     if anki_raw is not None:
-        g, v = clean_anki(anki_raw)
+        g, v = run_cleaner(clean_anki, anki_raw, args.workers, pos_cache_path)
         grammar_all.extend(g)
         vocab_all.extend(v)
+        validated.update(map(id, g + v))
 
     # Deduplicate by id
     grammar_all = merge_by_id(grammar_all)
     vocab_all = merge_by_id(vocab_all)
 
-    # Final validation
+    # Final validation (the unified JLPT entries are only checked here)
+    if args.strict:
+        validated.clear()
     bad_grammar = 0
     for it in grammar_all:
+        if id(it) in validated:
+            continue
         ok, errs = validate_item(it)
         if not ok:
             bad_grammar += 1
-            print(f"Invalid grammar {it.get('id')}: {errs[:2]}")
+            WARNINGS.append(f"Invalid grammar {it.get('id')}: {errs[:2]}")
     bad_vocab = 0
     for it in vocab_all:
+        if id(it) in validated:
+            continue
         ok, errs = validate_item(it)
         if not ok:
             bad_vocab += 1
-            print(f"Invalid vocab {it.get('id')}: {errs[:2]}")
+            WARNINGS.append(f"Invalid vocab {it.get('id')}: {errs[:2]}")
 
+    flush_warnings()
     print(f"Grammar: {len(grammar_all)} (invalid: {bad_grammar})")
     print(f"Vocab: {len(vocab_all)} (invalid: {bad_vocab})")
 
@@ -654,6 +927,13 @@ def main() -> None:
     write_json(out_vocab, vocab_all)
     print(f"Wrote {len(grammar_all)} → {out_grammar}")
     print(f"Wrote {len(vocab_all)} → {out_vocab}")
+    if args.ndjson:
+        write_ndjson(out_grammar.with_suffix(".ndjson"), grammar_all)
+        write_ndjson(out_vocab.with_suffix(".ndjson"), vocab_all)
+        print(f"Wrote NDJSON copies next to {out_grammar.name} and {out_vocab.name}")
+
+    if len(GINZA_POS_CACHE) != pos_cache_size:
+        save_pos_cache(pos_cache_path)
 
     # Export dropped entries to JSON for debugging
     if dropped_entries: